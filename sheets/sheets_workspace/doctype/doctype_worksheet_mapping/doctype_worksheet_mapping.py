@@ -2,11 +2,12 @@
 # For license information, please see license.txt
 
 import time
+from collections.abc import Iterable
 from csv import reader as csv_reader
 from csv import writer as csv_writer
 from difflib import SequenceMatcher
 from functools import cached_property
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from typing import TYPE_CHECKING
 
 import frappe
@@ -22,10 +23,23 @@ MAX_RETRIES = 3
 if TYPE_CHECKING:
     from frappe.core.doctype.data_import.data_import import DataImport
 
+    from sheets.sheets_workspace.doctype.spreadsheet.spreadsheet import SpreadSheet
+
 ACCEPTABLE_IMPORT_STATUSES = ("Success", "Partial Success")
+IMPORT_TYPES = {"Insert": INSERT, "Upsert": UPSERT}
 
 
 class DocTypeWorksheetMapping(Document):
+    @cached_property
+    def parent_doc(self) -> "SpreadSheet":
+        # resolved once per instance, a single import reads it from several steps
+        return super().parent_doc
+
+    def load_from_db(self):
+        self.__dict__.pop("parent_doc", None)
+        self.__dict__.pop("_import_file_prefix", None)
+        return super().load_from_db()
+
     def trigger_worksheet_import(self):
         if not self.mapped_doctype:
             frappe.throw("Mapped DocType is required to trigger import.")
@@ -76,11 +90,12 @@ class DocTypeWorksheetMapping(Document):
         # 1. generate csv file with all the inserted data imported
         data_imported_csv_file = []
         for csv_file in insert_csv_generator:  # order of imports (first to last)
-            rows = list(csv_reader(StringIO(csv_file)))
+            rows = csv_reader(StringIO(csv_file))
             if not data_imported_csv_file:
-                data_imported_csv_file = rows
+                data_imported_csv_file = list(rows)
             else:
-                data_imported_csv_file.extend(rows[1:])  # skip header
+                next(rows, None)  # skip header
+                data_imported_csv_file.extend(rows)
 
         if not data_imported_csv_file:
             frappe.msgprint(
@@ -114,27 +129,30 @@ class DocTypeWorksheetMapping(Document):
                         data_imported_csv_file[idx] = update_row
                         continue
 
-        # convert list of lists back to CSV lines using proper csv module
-        csv_buffer = StringIO()
-        csv_writer(csv_buffer).writerows(data_imported_csv_file)
-        data_imported_csv = csv_buffer.getvalue().splitlines()
+        # rows are compared as tuples since SequenceMatcher needs hashable items. Inserts
+        # fetched by range are only as wide as the header while full fetches are padded to
+        # the widest row of the sheet, so both sides are fitted to the imported header width
+        width = len(data_imported_csv_file_header)
+        data_imported_rows = [_fit_row(row, width) for row in data_imported_csv_file]
 
-        # 3. compare generated csv with remote csv to calculate updates
-        equivalent_remote_csv = self.fetch_remote_worksheet().splitlines()[: self.counter]
+        # 3. compare generated rows with remote rows to calculate updates
+        equivalent_remote_rows = [
+            _fit_row(row, width) for row in self.fetch_remote_worksheet()[: self.counter]
+        ]
 
         diff_opcodes = SequenceMatcher(
-            None, data_imported_csv, equivalent_remote_csv
+            None, data_imported_rows, equivalent_remote_rows
         ).get_grouped_opcodes(0)
         diff_slices = [y[3:5] for y in [x[1] for x in diff_opcodes]]
 
-        available_data_updates = data_imported_csv[:1] + [
-            item
-            for sublist in [equivalent_remote_csv[slice(*x)] for x in diff_slices]
+        available_data_updates = data_imported_csv_file[:1] + [
+            list(item)
+            for sublist in [equivalent_remote_rows[slice(*x)] for x in diff_slices]
             for item in sublist
         ]
 
         if len(available_data_updates) > 1:
-            di = self.create_data_import("\n".join(available_data_updates), import_type=UPDATE)
+            di = self.create_data_import(available_data_updates, import_type=UPDATE)
             di.start_import()
             self.last_update_import = di.name
             self.save()
@@ -170,33 +188,37 @@ class DocTypeWorksheetMapping(Document):
                 )
 
         data = self.fetch_remote_spreadsheet()
+        rows_added = max(len(data) - 1, 0)  # exclude header row
 
-        # length includes header row
-        if (counter := len(data.splitlines())) > 1:
-            di = self.create_data_import(data)
-            frappe.enqueue_doc(
-                di.doctype, di.name, method="start_import", enqueue_after_commit=True
-            )
-            self.last_import = di.name
-            self.counter = (self.counter or 1) + (counter - 1)  # subtract header row
-        else:
+        if not rows_added:
+            # nothing changed, skip building the import file and saving the mapping
             frappe.msgprint("No data found to import.", alert=True, indicator="orange")
+            return self
+
+        di = self.create_data_import(data)
+        frappe.enqueue_doc(di.doctype, di.name, method="start_import", enqueue_after_commit=True)
+        self.last_import = di.name
+        self.counter = (self.counter or 1) + rows_added
 
         return self.save()
 
     def get_import_type(self):
-        match self.import_type:
-            case "Insert":
-                return INSERT
-            case "Upsert":
-                return UPSERT
-            case _:
-                raise ValueError(f"Invalid import type: {self.import_type}")
+        try:
+            return IMPORT_TYPES[self.import_type]
+        except KeyError:
+            raise ValueError(
+                f"Invalid import type: {self.import_type}. "
+                f"Expected one of: {', '.join(IMPORT_TYPES)}"
+            ) from None
+
+    @cached_property
+    def _import_file_prefix(self) -> str:
+        return f"{self.parent_doc.sheet_name}-worksheet-{self.worksheet_id}-"
 
     def generate_import_file_name(self):
-        return f"{self.parent_doc.sheet_name}-worksheet-{self.worksheet_id}-{frappe.generate_hash(length=6)}.csv"
+        return f"{self._import_file_prefix}{frappe.generate_hash(length=6)}.csv"
 
-    def create_data_import(self, data: str, import_type=INSERT) -> "DataImport":
+    def create_data_import(self, data: Iterable[list[str]], import_type=INSERT) -> "DataImport":
         data_import = frappe.new_doc("Data Import")
         data_import.update(
             {
@@ -218,7 +240,12 @@ class DocTypeWorksheetMapping(Document):
                 "is_private": 1,
             }
         )
-        import_file.content = data.encode("utf-8")
+        # encode rows as they are written instead of building the whole CSV as str first
+        content = BytesIO()
+        text_stream = TextIOWrapper(content, encoding="utf-8", newline="", write_through=True)
+        csv_writer(text_stream).writerows(data)
+        text_stream.detach()
+        import_file.content = content.getvalue()
         import_file.save()
 
         data_import.spreadsheet_id = self.parent_doc.name
@@ -228,14 +255,18 @@ class DocTypeWorksheetMapping(Document):
 
         return data_import.save()
 
-    def fetch_remote_worksheet(self):
+    def fetch_remote_worksheet(self, start_row: int | None = None) -> list[list[str]]:
+        """Fetch the worksheet rows, header included.
+
+        When `start_row` is passed, only the header and rows from `start_row` onwards
+        are requested from the Sheets API instead of the whole worksheet.
+        """
         import gspread as gs
+        from gspread.utils import rowcol_to_a1
 
         for attempt in range(1 + MAX_RETRIES):
             try:
-                remote_spreadsheet = self.parent_doc.get_sheet_client().open_by_url(
-                    self.parent_doc.sheet_url
-                )
+                remote_spreadsheet = self.parent_doc.get_remote_spreadsheet()
                 remote_worksheet = remote_spreadsheet.get_worksheet_by_id(self.worksheet_id)
                 break
             except gs.exceptions.APIError as e:
@@ -253,13 +284,27 @@ class DocTypeWorksheetMapping(Document):
                     title="Worksheet Not Found",
                 )
 
-        values = remote_worksheet.get_all_values()
-        if not values:
-            return ""
+        if not start_row:
+            return remote_worksheet.get_all_values()
+
+        header = remote_worksheet.row_values(1)
+        if not header:
+            return []
+
+        # ranges past the worksheet grid are rejected by the values API
+        if start_row > remote_worksheet.row_count:
+            return [header]
 
-        buffer = StringIO()
-        csv_writer(buffer).writerows(values)
-        return buffer.getvalue()
+        last_column = rowcol_to_a1(1, len(header)).rstrip("1")
+        rows = remote_worksheet.get(f"A{start_row}:{last_column}")
+        # an empty range comes back as [[]], not as an empty list
+        if not any(rows):
+            return [header]
+
+        # the values API trims trailing empty cells, pad them back like get_all_values
+        for row in rows:
+            row.extend([""] * (len(header) - len(row)))
+        return [header, *rows]
 
     def preview_data(self, max_rows=10) -> dict:
         """Fetch a preview of the worksheet data for mapping verification.
@@ -273,9 +318,7 @@ class DocTypeWorksheetMapping(Document):
         import gspread as gs
 
         try:
-            remote_spreadsheet = self.parent_doc.get_sheet_client().open_by_url(
-                self.parent_doc.sheet_url
-            )
+            remote_spreadsheet = self.parent_doc.get_remote_spreadsheet()
             remote_worksheet = remote_spreadsheet.get_worksheet_by_id(self.worksheet_id)
         except (gs.exceptions.APIError, gs.exceptions.WorksheetNotFound):
             return {"header": [], "rows": [], "total_rows": 0, "field_mapping": {}}
@@ -285,8 +328,7 @@ class DocTypeWorksheetMapping(Document):
             return {"header": [], "rows": [], "total_rows": 0, "field_mapping": {}}
 
         header = values[0]
-        data_rows = values[1:]
-        total_rows = len(data_rows)
+        total_rows = len(values) - 1
 
         field_mapping = {}
         if self.mapped_doctype:
@@ -300,42 +342,42 @@ class DocTypeWorksheetMapping(Document):
 
         return {
             "header": header,
-            "rows": data_rows[:max_rows],
+            "rows": values[1 : max_rows + 1],
             "total_rows": total_rows,
             "field_mapping": field_mapping,
         }
 
-    def fetch_remote_spreadsheet(self) -> str:
-        full_sheet_content = self.fetch_remote_worksheet()
+    def fetch_remote_spreadsheet(self) -> list[list[str]]:
         counter = 0 if self.reset_worksheet_on_import else self.counter
 
-        if counter:
-            full_sheet_lines = full_sheet_content.splitlines()
-            return "\n".join(full_sheet_lines[:1] + full_sheet_lines[counter:])
-        return full_sheet_content
+        # counter includes the header row, skip the imported rows on the server side
+        if (counter or 0) > 1:
+            return self.fetch_remote_worksheet(start_row=counter + 1)
+        return self.fetch_remote_worksheet()
 
     @cached_property
     def worksheet_id_field(self) -> str:
-        worksheet_gdoc = (
-            self.parent_doc.get_sheet_client()
-            .open_by_url(self.parent_doc.sheet_url)
-            .get_worksheet_by_id(self.worksheet_id)
+        worksheet_gdoc = self.parent_doc.get_remote_spreadsheet().get_worksheet_by_id(
+            self.worksheet_id
         )
-        header_row = worksheet_gdoc.row_values(1)
+        # hashed once, every candidate below is a constant time lookup
+        header_columns = frozenset(worksheet_gdoc.row_values(1))
 
-        if "ID" in header_row:
+        if "ID" in header_columns:
             return "ID"
 
         autoname_field = get_autoname_field(self.mapped_doctype)
-        if autoname_field and autoname_field.label in header_row:
+        if autoname_field and autoname_field.label in header_columns:
             return autoname_field.label
 
         dt = frappe.get_meta(self.mapped_doctype)
-        unique_fields = [df.label for df in dt.fields if df.unique]
-
-        for field in unique_fields:
-            if field in header_row:
-                return field
+        for df in dt.fields:
+            if df.unique and df.label in header_columns:
+                return df.label
 
         # Note: Should we provide a `self.id_field` field to allow users to specify the ID field?
         frappe.throw(f"Could not find ID or Unique field in {self.doctype}")
+
+
+def _fit_row(row: list[str], width: int) -> tuple[str, ...]:
+    return tuple(row[:width]) + ("",) * (width - len(row))
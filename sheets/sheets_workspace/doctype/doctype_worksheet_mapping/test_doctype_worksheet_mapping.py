@@ -2,51 +2,83 @@
 # See license.txt
 
 from csv import reader as csv_reader
+from csv import writer as csv_writer
 from io import StringIO
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import frappe
+from frappe.model.document import Document
 from frappe.tests.utils import FrappeTestCase
 
 from sheets.constants import INSERT, UPDATE, UPSERT
+from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
+    DocTypeWorksheetMapping,
+)
 
 
-def make_csv(*rows):
-    """Helper to create CSV string from rows (list of lists)."""
-    from csv import writer as csv_writer
+class FakeWorksheet:
+    """Minimal stand-in for a gspread Worksheet serving fixed values."""
 
-    buf = StringIO()
-    csv_writer(buf).writerows(rows)
-    return buf.getvalue()
+    def __init__(self, values, header=None, row_count=1000):
+        self._values = values
+        self._header = header
+        self.row_count = row_count
+        self.calls = []
 
+    def get_all_values(self):
+        self.calls.append(("get_all_values",))
+        return self._values
 
-class TestGetImportType(FrappeTestCase):
-    """Tests for DocTypeWorksheetMapping.get_import_type()."""
+    def row_values(self, row):
+        self.calls.append(("row_values", row))
+        if self._header is not None:
+            return self._header
+        return self._values[0] if self._values else []
+
+    def get(self, range_name):
+        self.calls.append(("get", range_name))
+        # gspread returns [[]] when the range holds no values
+        return self._values or [[]]
+
+
+class FakeParent:
+    """Minimal stand-in for the parent SpreadSheet serving a single worksheet."""
+
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def get_remote_spreadsheet(self):
+        return self
+
+    def get_worksheet_by_id(self, worksheet_id):
+        return self._worksheet
 
-    def _make_mapping(self, import_type):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
 
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.import_type = import_type
-        return mapping
+def _mapping(**fields):
+    """Build a DocTypeWorksheetMapping without touching the database."""
+    mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
+    vars(mapping).update(fields)
+    return mapping
+
+
+class TestGetImportType(FrappeTestCase):
+    """Tests for DocTypeWorksheetMapping.get_import_type()."""
 
     def test_insert_type(self):
-        mapping = self._make_mapping("Insert")
+        mapping = _mapping(import_type="Insert")
         self.assertEqual(mapping.get_import_type(), INSERT)
 
     def test_upsert_type(self):
-        mapping = self._make_mapping("Upsert")
+        mapping = _mapping(import_type="Upsert")
         self.assertEqual(mapping.get_import_type(), UPSERT)
 
     def test_invalid_type_raises(self):
-        mapping = self._make_mapping("Delete")
+        mapping = _mapping(import_type="Delete")
         with self.assertRaises(ValueError):
             mapping.get_import_type()
 
     def test_empty_type_raises(self):
-        mapping = self._make_mapping("")
+        mapping = _mapping(import_type="")
         with self.assertRaises(ValueError):
             mapping.get_import_type()
 
@@ -54,34 +86,28 @@ class TestGetImportType(FrappeTestCase):
 class TestTriggerWorksheetImport(FrappeTestCase):
     """Tests for DocTypeWorksheetMapping.trigger_worksheet_import() routing."""
 
-    def _make_mapping(self, import_type):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+    def test_routes_insert(self):
+        calls = []
+        mapping = _mapping(import_type="Insert", mapped_doctype="ToDo")
+        mapping.trigger_insert_worksheet_import = lambda *args, **kwargs: calls.append(
+            (args, kwargs)
         )
 
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.import_type = import_type
-        mapping.mapped_doctype = "ToDo"
-        return mapping
-
-    @patch(
-        "sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping.DocTypeWorksheetMapping.trigger_insert_worksheet_import"
-    )
-    def test_routes_insert(self, mock_insert):
-        mapping = self._make_mapping("Insert")
         mapping.trigger_worksheet_import()
-        mock_insert.assert_called_once()
+        self.assertEqual(calls, [((), {})])
+
+    def test_routes_upsert(self):
+        calls = []
+        mapping = _mapping(import_type="Upsert", mapped_doctype="ToDo")
+        mapping.trigger_upsert_worksheet_import = lambda *args, **kwargs: calls.append(
+            (args, kwargs)
+        )
 
-    @patch(
-        "sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping.DocTypeWorksheetMapping.trigger_upsert_worksheet_import"
-    )
-    def test_routes_upsert(self, mock_upsert):
-        mapping = self._make_mapping("Upsert")
         mapping.trigger_worksheet_import()
-        mock_upsert.assert_called_once()
+        self.assertEqual(calls, [((), {})])
 
     def test_routes_invalid_raises(self):
-        mapping = self._make_mapping("Invalid")
+        mapping = _mapping(import_type="Invalid", mapped_doctype="ToDo")
         with self.assertRaises(ValueError):
             mapping.trigger_worksheet_import()
 
@@ -89,174 +115,188 @@ class TestTriggerWorksheetImport(FrappeTestCase):
 class TestFetchRemoteSpreadsheet(FrappeTestCase):
     """Tests for fetch_remote_spreadsheet() counter/slicing logic."""
 
-    def _make_mapping(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        return mapping
-
     def test_returns_all_rows_when_counter_is_zero(self):
-        mapping = self._make_mapping()
-        mapping.reset_worksheet_on_import = True
+        mapping = _mapping(reset_worksheet_on_import=True)
 
-        csv_data = make_csv(
+        data = [
             ["Name", "Email"],
             ["Alice", "alice@example.com"],
             ["Bob", "bob@example.com"],
-        )
+        ]
 
-        with patch.object(mapping, "fetch_remote_worksheet", return_value=csv_data):
-            result = mapping.fetch_remote_spreadsheet()
-            rows = list(csv_reader(StringIO(result)))
+        with patch.object(mapping, "fetch_remote_worksheet", return_value=data):
+            rows = mapping.fetch_remote_spreadsheet()
             self.assertEqual(len(rows), 3)  # header + 2 data rows
             self.assertEqual(rows[0], ["Name", "Email"])
 
     def test_skips_already_imported_rows(self):
-        mapping = self._make_mapping()
-        mapping.counter = 2  # already imported first data row
-        mapping.reset_worksheet_on_import = False
-
-        csv_data = make_csv(
-            ["Name", "Email"],
-            ["Alice", "alice@example.com"],
-            ["Bob", "bob@example.com"],
-            ["Charlie", "charlie@example.com"],
+        worksheet = FakeWorksheet(
+            [
+                ["Bob", "bob@example.com"],
+                ["Charlie"],  # trailing empty cells are trimmed by the API
+            ],
+            header=["Name", "Email"],
         )
-
-        with patch.object(mapping, "fetch_remote_worksheet", return_value=csv_data):
-            result = mapping.fetch_remote_spreadsheet()
-            rows = list(csv_reader(StringIO(result)))
-            # header + rows after counter (Bob and Charlie)
-            self.assertEqual(len(rows), 3)
-            self.assertEqual(rows[0], ["Name", "Email"])
-            self.assertEqual(rows[1], ["Bob", "bob@example.com"])
-            self.assertEqual(rows[2], ["Charlie", "charlie@example.com"])
-
-    def test_returns_only_header_when_all_imported(self):
-        mapping = self._make_mapping()
-        mapping.counter = 3  # all 3 data rows already imported
-        mapping.reset_worksheet_on_import = False
-
-        csv_data = make_csv(
-            ["Name", "Email"],
-            ["Alice", "alice@example.com"],
-            ["Bob", "bob@example.com"],
+        mapping = _mapping(
+            worksheet_id=0,
+            counter=2,  # already imported first data row
+            reset_worksheet_on_import=False,
+            parent_doc=FakeParent(worksheet),
         )
 
-        with patch.object(mapping, "fetch_remote_worksheet", return_value=csv_data):
-            result = mapping.fetch_remote_spreadsheet()
-            rows = list(csv_reader(StringIO(result)))
-            # only header remains
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0], ["Name", "Email"])
+        rows = mapping.fetch_remote_spreadsheet()
 
+        # only rows after counter are requested from the API
+        self.assertEqual(worksheet.calls, [("row_values", 1), ("get", "A3:B")])
 
-class TestFetchRemoteWorksheet(FrappeTestCase):
-    """Tests for fetch_remote_worksheet() CSV conversion."""
+        # header + rows after counter (Bob and Charlie)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0], ["Name", "Email"])
+        self.assertEqual(rows[1], ["Bob", "bob@example.com"])
+        self.assertEqual(rows[2], ["Charlie", ""])
 
-    def setUp(self):
-        super().setUp()
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+    def test_returns_only_header_when_all_imported(self):
+        worksheet = FakeWorksheet([], header=["Name", "Email"])
+        mapping = _mapping(
+            worksheet_id=0,
+            counter=3,  # both data rows already imported
+            reset_worksheet_on_import=False,
+            parent_doc=FakeParent(worksheet),
         )
 
-        self._mock_parent = MagicMock()
-        self._parent_doc_patcher = patch.object(
-            DocTypeWorksheetMapping, "parent_doc", new_callable=PropertyMock, return_value=self._mock_parent
-        )
-        self._parent_doc_patcher.start()
+        rows = mapping.fetch_remote_spreadsheet()
 
-    def tearDown(self):
-        self._parent_doc_patcher.stop()
-        super().tearDown()
+        self.assertEqual(worksheet.calls, [("row_values", 1), ("get", "A4:B")])
+        # only header remains
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0], ["Name", "Email"])
 
-    def _make_mapping(self, worksheet_id=0):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+    def test_skips_range_request_past_worksheet_grid(self):
+        worksheet = FakeWorksheet([], header=["Name", "Email"], row_count=3)
+        mapping = _mapping(
+            worksheet_id=0,
+            counter=3,  # every row of the grid already imported
+            reset_worksheet_on_import=False,
+            parent_doc=FakeParent(worksheet),
         )
 
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.worksheet_id = worksheet_id
+        rows = mapping.fetch_remote_spreadsheet()
 
-        return mapping, self._mock_parent
+        # A4 lies outside a 3 row grid, so no range is requested at all
+        self.assertEqual(worksheet.calls, [("row_values", 1)])
+        self.assertEqual(rows, [["Name", "Email"]])
 
-    def test_converts_values_to_csv(self):
-        mapping, mock_parent = self._make_mapping()
-        mock_worksheet = MagicMock()
-        mock_worksheet.get_all_values.return_value = [
-            ["Name", "Email"],
-            ["Alice", "alice@example.com"],
-        ]
-        mock_parent.get_sheet_client().open_by_url().get_worksheet_by_id.return_value = (
-            mock_worksheet
+
+class TestFetchRemoteWorksheet(FrappeTestCase):
+    """Tests for fetch_remote_worksheet() row retrieval."""
+
+    def test_returns_values_as_rows(self):
+        mapping = _mapping(
+            worksheet_id=0,
+            parent_doc=FakeParent(
+                FakeWorksheet(
+                    [
+                        ["Name", "Email"],
+                        ["Alice", "alice@example.com"],
+                    ]
+                )
+            ),
         )
 
-        result = mapping.fetch_remote_worksheet()
-        rows = list(csv_reader(StringIO(result)))
+        rows = mapping.fetch_remote_worksheet()
         self.assertEqual(rows[0], ["Name", "Email"])
         self.assertEqual(rows[1], ["Alice", "alice@example.com"])
 
-    def test_handles_special_characters_in_csv(self):
-        mapping, mock_parent = self._make_mapping()
-        mock_worksheet = MagicMock()
-        mock_worksheet.get_all_values.return_value = [
-            ["Name", "Description"],
-            ["Alice, Bob", 'She said "hello"'],
-            ["Charlie\nNewline", "normal"],
-        ]
-        mock_parent.get_sheet_client().open_by_url().get_worksheet_by_id.return_value = (
-            mock_worksheet
+    def test_preserves_special_characters(self):
+        mapping = _mapping(
+            worksheet_id=0,
+            parent_doc=FakeParent(
+                FakeWorksheet(
+                    [
+                        ["Name", "Description"],
+                        ["Alice, Bob", 'She said "hello"'],
+                        ["Charlie\nNewline", "normal"],
+                    ]
+                )
+            ),
         )
 
-        result = mapping.fetch_remote_worksheet()
-        rows = list(csv_reader(StringIO(result)))
+        rows = mapping.fetch_remote_worksheet()
         self.assertEqual(rows[0], ["Name", "Description"])
         self.assertEqual(rows[1], ["Alice, Bob", 'She said "hello"'])
         self.assertEqual(rows[2], ["Charlie\nNewline", "normal"])
 
     def test_handles_empty_worksheet(self):
-        mapping, mock_parent = self._make_mapping()
-        mock_worksheet = MagicMock()
-        mock_worksheet.get_all_values.return_value = []
-        mock_parent.get_sheet_client().open_by_url().get_worksheet_by_id.return_value = (
-            mock_worksheet
-        )
+        mapping = _mapping(worksheet_id=0, parent_doc=FakeParent(FakeWorksheet([])))
 
         result = mapping.fetch_remote_worksheet()
-        self.assertEqual(result.strip(), "")
+        self.assertEqual(result, [])
 
 
 class TestGenerateImportFileName(FrappeTestCase):
     """Tests for generate_import_file_name()."""
 
     def test_filename_format(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
         mock_parent = MagicMock()
         mock_parent.sheet_name = "Test Sheet"
 
         with patch.object(DocTypeWorksheetMapping, "parent_doc", new_callable=PropertyMock, return_value=mock_parent):
-            mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-            mapping.worksheet_id = 42
+            mapping = _mapping(worksheet_id=42)
 
             filename = mapping.generate_import_file_name()
             self.assertTrue(filename.startswith("Test Sheet-worksheet-42-"))
             self.assertTrue(filename.endswith(".csv"))
 
+    def test_filename_prefix_is_cached(self):
+        mock_parent = MagicMock()
+        mock_parent.sheet_name = "Test Sheet"
+        mapping = _mapping(worksheet_id=42, parent_doc=mock_parent)
+
+        first = mapping.generate_import_file_name()
+        mock_parent.sheet_name = "Renamed Sheet"
+        second = mapping.generate_import_file_name()
+
+        self.assertTrue(second.startswith("Test Sheet-worksheet-42-"))
+        self.assertNotEqual(first, second)
+
+
+class TestParentDocCaching(FrappeTestCase):
+    """Tests for parent_doc being resolved once per mapping instance."""
+
+    def test_parent_doc_is_resolved_once(self):
+        mock_parent = MagicMock()
+        mapping = _mapping()
+
+        with patch.object(
+            Document, "parent_doc", new_callable=PropertyMock, return_value=mock_parent, create=True
+        ) as mock_parent_doc:
+            self.assertIs(mapping.parent_doc, mock_parent)
+            self.assertIs(mapping.parent_doc, mock_parent)
+
+        mock_parent_doc.assert_called_once()
+
 
 class TestCreateDataImport(FrappeTestCase):
     """Tests for create_data_import() document creation."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Enable allow_import for ToDo if not already set (required in Frappe v16+)
+        cls._todo_allow_import = frappe.db.get_value("DocType", "ToDo", "allow_import")
+        if not cls._todo_allow_import:
+            frappe.db.set_value("DocType", "ToDo", "allow_import", 1)
+            frappe.clear_cache(doctype="ToDo")
+
+    @classmethod
+    def tearDownClass(cls):
+        if not cls._todo_allow_import:
+            frappe.db.set_value("DocType", "ToDo", "allow_import", 0)
+            frappe.clear_cache(doctype="ToDo")
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
         self._mock_parent = MagicMock()
         self._mock_parent.sheet_name = "Test Sheet"
         self._mock_parent.name = "test-spreadsheet-001"
@@ -265,38 +305,24 @@ class TestCreateDataImport(FrappeTestCase):
         )
         self._parent_doc_patcher.start()
 
-        # Enable allow_import for ToDo if not already set (required in Frappe v16+)
-        self._todo_allow_import = frappe.db.get_value("DocType", "ToDo", "allow_import")
-        if not self._todo_allow_import:
-            frappe.db.set_value("DocType", "ToDo", "allow_import", 1)
-            frappe.clear_cache(doctype="ToDo")
-
     def tearDown(self):
         self._parent_doc_patcher.stop()
-        if not self._todo_allow_import:
-            frappe.db.set_value("DocType", "ToDo", "allow_import", 0)
-            frappe.clear_cache(doctype="ToDo")
         super().tearDown()
 
     def _make_mapping(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+        return _mapping(
+            mapped_doctype="ToDo",
+            mute_emails=1,
+            submit_after_import=0,
+            worksheet_id=0,
+            name="test-mapping-001",
         )
 
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.mapped_doctype = "ToDo"
-        mapping.mute_emails = 1
-        mapping.submit_after_import = 0
-        mapping.worksheet_id = 0
-        mapping.name = "test-mapping-001"
-
-        return mapping
-
     def test_creates_data_import_with_correct_fields(self):
         mapping = self._make_mapping()
-        csv_data = make_csv(["Name", "Status"], ["Test Todo", "Open"])
+        data = [["Name", "Status"], ["Test Todo", "Open"]]
 
-        di = mapping.create_data_import(csv_data, import_type=INSERT)
+        di = mapping.create_data_import(data, import_type=INSERT)
 
         self.assertEqual(di.reference_doctype, "ToDo")
         self.assertEqual(di.import_type, INSERT)
@@ -318,25 +344,55 @@ class TestCreateDataImport(FrappeTestCase):
 
     def test_creates_data_import_for_update(self):
         mapping = self._make_mapping()
-        csv_data = make_csv(["ID", "Status"], ["TODO-001", "Closed"])
+        data = [["ID", "Status"], ["TODO-001", "Closed"]]
 
-        di = mapping.create_data_import(csv_data, import_type=UPDATE)
+        di = mapping.create_data_import(data, import_type=UPDATE)
 
         self.assertEqual(di.import_type, UPDATE)
 
         # cleanup
         frappe.delete_doc("Data Import", di.name, force=True)
 
+    def test_identical_content_reuses_stored_file(self):
+        mapping = self._make_mapping()
+        data = [["Name", "Status"], ["Repeat Todo", "Open"]]
+
+        first = mapping.create_data_import(data)
+        second = mapping.create_data_import(data)
+
+        # File rows stay per Data Import, the content is stored once by content_hash
+        first_file = frappe.get_doc("File", {"attached_to_name": first.name})
+        second_file = frappe.get_doc("File", {"attached_to_name": second.name})
+        self.assertNotEqual(first_file.name, second_file.name)
+        self.assertEqual(first_file.content_hash, second_file.content_hash)
+        self.assertEqual(second.import_file, first.import_file)
+
+        # cleanup
+        frappe.delete_doc("Data Import", second.name, force=True)
+        frappe.delete_doc("Data Import", first.name, force=True)
+
 
 class TestTriggerInsertWorksheetImport(FrappeTestCase):
     """Tests for trigger_insert_worksheet_import() logic."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Enable allow_import for ToDo if not already set (required in Frappe v16+)
+        cls._todo_allow_import = frappe.db.get_value("DocType", "ToDo", "allow_import")
+        if not cls._todo_allow_import:
+            frappe.db.set_value("DocType", "ToDo", "allow_import", 1)
+            frappe.clear_cache(doctype="ToDo")
+
+    @classmethod
+    def tearDownClass(cls):
+        if not cls._todo_allow_import:
+            frappe.db.set_value("DocType", "ToDo", "allow_import", 0)
+            frappe.clear_cache(doctype="ToDo")
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
         self._mock_parent = MagicMock()
         self._mock_parent.sheet_name = "Test Sheet"
         self._mock_parent.name = "test-spreadsheet-insert"
@@ -345,55 +401,40 @@ class TestTriggerInsertWorksheetImport(FrappeTestCase):
         )
         self._parent_doc_patcher.start()
 
-        # Enable allow_import for ToDo if not already set (required in Frappe v16+)
-        self._todo_allow_import = frappe.db.get_value("DocType", "ToDo", "allow_import")
-        if not self._todo_allow_import:
-            frappe.db.set_value("DocType", "ToDo", "allow_import", 1)
-            frappe.clear_cache(doctype="ToDo")
-
     def tearDown(self):
         self._parent_doc_patcher.stop()
-        if not self._todo_allow_import:
-            frappe.db.set_value("DocType", "ToDo", "allow_import", 0)
-            frappe.clear_cache(doctype="ToDo")
         super().tearDown()
 
     def _make_mapping(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+        return _mapping(
+            mapped_doctype="ToDo",
+            mute_emails=1,
+            submit_after_import=0,
+            worksheet_id=0,
+            counter=1,
+            last_import=None,
+            reset_worksheet_on_import=False,
+            name="test-mapping-insert",
+            flags=frappe._dict(),
+            docstatus=0,
+            # child table fields
+            parenttype="SpreadSheet",
+            parent=self._mock_parent.name,
+            parentfield="worksheet_ids",
+            idx=1,
         )
 
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.mapped_doctype = "ToDo"
-        mapping.mute_emails = 1
-        mapping.submit_after_import = 0
-        mapping.worksheet_id = 0
-        mapping.counter = 1
-        mapping.last_import = None
-        mapping.reset_worksheet_on_import = False
-        mapping.name = "test-mapping-insert"
-        mapping.flags = frappe._dict()
-        mapping.docstatus = 0
-
-        mapping.parenttype = "SpreadSheet"
-        mapping.parent = self._mock_parent.name
-        mapping.parentfield = "worksheet_ids"
-        mapping.idx = 1
-
-        return mapping
-
     @patch(
         "sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping.DocTypeWorksheetMapping.fetch_remote_spreadsheet"
     )
     @patch("frappe.enqueue_doc")
     def test_insert_creates_data_import_and_updates_counter(self, mock_enqueue, mock_fetch):
         mapping = self._make_mapping()
-        csv_data = make_csv(
+        mock_fetch.return_value = [
             ["Description", "Status"],
             ["Task 1", "Open"],
             ["Task 2", "Open"],
-        )
-        mock_fetch.return_value = csv_data
+        ]
 
         # We need to mock save since this is a child table
         with patch.object(mapping, "save", return_value=mapping):
@@ -414,15 +455,19 @@ class TestTriggerInsertWorksheetImport(FrappeTestCase):
     def test_insert_skips_when_no_data(self, mock_fetch):
         mapping = self._make_mapping()
         # only header, no data rows
-        csv_data = make_csv(["Description", "Status"])
-        mock_fetch.return_value = csv_data
+        mock_fetch.return_value = [["Description", "Status"]]
 
-        with patch.object(mapping, "save", return_value=mapping):
+        with patch.object(mapping, "save", return_value=mapping) as mock_save, patch.object(
+            mapping, "create_data_import"
+        ) as mock_create:
             mapping.trigger_insert_worksheet_import()
 
         # counter should not change when there's no data
         self.assertEqual(mapping.counter, 1)
         self.assertIsNone(mapping.last_import)
+        # no import file is built and the unchanged mapping isn't saved
+        mock_create.assert_not_called()
+        mock_save.assert_not_called()
 
     def test_insert_throws_when_last_import_failed(self):
         mapping = self._make_mapping()
@@ -447,68 +492,37 @@ class TestTriggerInsertWorksheetImport(FrappeTestCase):
 class TestWorksheetIdField(FrappeTestCase):
     """Tests for worksheet_id_field cached property."""
 
-    def _make_mapping(self, header_row, mapped_doctype="ToDo"):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.mapped_doctype = mapped_doctype
-        mapping.worksheet_id = 0
-        mapping.doctype = "DocType Worksheet Mapping"
-
-        mock_parent = MagicMock()
-        mock_worksheet = MagicMock()
-        mock_worksheet.row_values.return_value = header_row
-        mock_parent.get_sheet_client().open_by_url().get_worksheet_by_id.return_value = (
-            mock_worksheet
-        )
-
-        return mapping, mock_parent
-
     def test_returns_id_when_present(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+        mapping = _mapping(
+            mapped_doctype="ToDo",
+            worksheet_id=0,
+            doctype="DocType Worksheet Mapping",
+            parent_doc=FakeParent(FakeWorksheet([], header=["ID", "Name", "Email"])),
         )
-
-        mapping, mock_parent = self._make_mapping(["ID", "Name", "Email"])
-        with patch.object(DocTypeWorksheetMapping, "parent_doc", new_callable=PropertyMock, return_value=mock_parent):
-            self.assertEqual(mapping.worksheet_id_field, "ID")
+        self.assertEqual(mapping.worksheet_id_field, "ID")
 
     def test_throws_when_no_id_field_found(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
+        mapping = _mapping(
+            mapped_doctype="ToDo",
+            worksheet_id=0,
+            doctype="DocType Worksheet Mapping",
+            parent_doc=FakeParent(FakeWorksheet([], header=["RandomCol1", "RandomCol2"])),
         )
-
-        mapping, mock_parent = self._make_mapping(["RandomCol1", "RandomCol2"])
-        with patch.object(DocTypeWorksheetMapping, "parent_doc", new_callable=PropertyMock, return_value=mock_parent):
-            with self.assertRaises(frappe.exceptions.ValidationError):
-                _ = mapping.worksheet_id_field
+        with self.assertRaises(frappe.exceptions.ValidationError):
+            _ = mapping.worksheet_id_field
 
 
 class TestMappedDoctypeValidation(FrappeTestCase):
     """Tests for mapped_doctype validation on import trigger."""
 
     def test_throws_when_mapped_doctype_empty(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.mapped_doctype = ""
-        mapping.import_type = "Insert"
+        mapping = _mapping(mapped_doctype="", import_type="Insert")
 
         with self.assertRaises(frappe.exceptions.ValidationError):
             mapping.trigger_worksheet_import()
 
     def test_throws_when_mapped_doctype_none(self):
-        from sheets.sheets_workspace.doctype.doctype_worksheet_mapping.doctype_worksheet_mapping import (
-            DocTypeWorksheetMapping,
-        )
-
-        mapping = DocTypeWorksheetMapping.__new__(DocTypeWorksheetMapping)
-        mapping.mapped_doctype = None
-        mapping.import_type = "Insert"
+        mapping = _mapping(mapped_doctype=None, import_type="Insert")
 
         with self.assertRaises(frappe.exceptions.ValidationError):
             mapping.trigger_worksheet_import()
@@ -523,8 +537,6 @@ class TestUpsertCsvHandling(FrappeTestCase):
         This is a regression test for the bug where manual ','.join() was used
         instead of the csv module, causing values with commas to break.
         """
-        from csv import writer as csv_writer
-
         # Simulate the fixed code path: list-of-lists -> CSV lines
         data = [
             ["Name", "Description", "ID"],
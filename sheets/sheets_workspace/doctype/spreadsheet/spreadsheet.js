@@ -78,7 +78,14 @@ frappe.ui.form.on("SpreadSheet", {
         });
 
         frm.add_custom_button("Trigger Import", () => {
-            frm.call("trigger_import");
+            // worksheets import in background jobs that bump the sheet when done, the form
+            // reloads with their counters on that doc_update rather than on this response
+            frm.call("trigger_import").then(() => {
+                frm.dashboard.set_headline(
+                    "Import running in the background, this form reloads when it's done.",
+                    "blue"
+                );
+            });
         });
     },
 });
@@ -8,7 +8,7 @@ import frappe
 import gspread as gs
 from croniter import croniter
 from frappe.model.document import Document
-from frappe.utils import get_link_to_form
+from frappe.utils import get_link_to_form, now
 
 import sheets
 from sheets.api import describe_cron, get_all_frequency
@@ -55,6 +55,13 @@ class SpreadSheet(Document):
             self._gc = gs.service_account(file.get_full_path())
         return self._gc
 
+    def get_remote_spreadsheet(self) -> "gs.Spreadsheet":
+        # opened once per sheet url, shared by all worksheet mappings of this document
+        if getattr(self, "_remote_spreadsheet_url", None) != self.sheet_url:
+            self._remote_spreadsheet = self.get_sheet_client().open_by_url(self.sheet_url)
+            self._remote_spreadsheet_url = self.sheet_url
+        return self._remote_spreadsheet
+
     def validate(self):
         self.validate_base_settings()
         self.validate_sync_settings()
@@ -120,7 +127,7 @@ class SpreadSheet(Document):
         sheet_client = self.get_sheet_client()
 
         try:
-            sheet = sheet_client.open_by_url(self.sheet_url)
+            sheet = self.get_remote_spreadsheet()
         except gs.exceptions.APIError as e:
             frappe.throw(
                 f"Share spreadsheet with the following Service Account Email and try again: <b>{sheet_client.http_client.auth.service_account_email}</b>",
@@ -154,12 +161,38 @@ class SpreadSheet(Document):
 
     @frappe.whitelist()
     def trigger_import(self):
-        with patch_importer():
-            for worksheet in self.worksheet_ids:
-                worksheet.trigger_worksheet_import()
-            self.save()
+        # one job per worksheet so their Google Sheets round trips overlap, deduplicated so
+        # a poll never starts a second import of a worksheet still being imported
+        for worksheet in self.worksheet_ids:
+            frappe.enqueue(
+                trigger_worksheet_import,
+                queue="long",
+                job_id=f"sheets-import::{self.name}::{worksheet.name}",
+                deduplicate=True,
+                spreadsheet=self.name,
+                worksheet=worksheet.name,
+                enqueue_after_commit=True,
+            )
+        # the jobs update the document once they're done, so there's no fresh state to return
         frappe.msgprint("Import Triggered Successfully", indicator="blue", alert=True)
-        return self
+
+
+def trigger_worksheet_import(spreadsheet: str, worksheet: str):
+    sheet: SpreadSheet = frappe.get_doc("SpreadSheet", spreadsheet)
+
+    # the worksheet may have been removed from the sheet after the job was queued
+    if not (mappings := sheet.get("worksheet_ids", {"name": worksheet})):
+        return
+
+    mapping: "DocTypeWorksheetMapping" = mappings[0]
+
+    # the mapping saves its own row, leaving sibling worksheet jobs untouched
+    with patch_importer():
+        mapping.trigger_worksheet_import()
+
+    # bump the parent too, so a form holding the old counters gets a timestamp mismatch
+    # on save instead of writing them back, and open forms reload with the new ones
+    sheet.db_set("modified", now(), notify=True)
 
 
 @contextmanager
@@ -4,6 +4,7 @@
 import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest.mock import ANY, MagicMock, patch
 
 import frappe
 from frappe.core.doctype.data_import.importer import Importer
@@ -11,7 +12,11 @@ from frappe.tests.utils import FrappeTestCase
 from frappe.utils import get_site_url
 from requests import get
 
-from sheets.sheets_workspace.doctype.spreadsheet.spreadsheet import patch_importer
+from sheets.sheets_workspace.doctype.spreadsheet.spreadsheet import (
+    SpreadSheet,
+    patch_importer,
+    trigger_worksheet_import,
+)
 
 
 def whitelist_for_ci(fn):
@@ -41,3 +46,81 @@ class TestSpreadSheet(FrappeTestCase):
             for future in as_completed(futures):
                 res = future.result().json()["message"]
                 self.assertEqual(res[0], res[1])
+
+    def test_remote_spreadsheet_opened_once(self):
+        spreadsheet = SpreadSheet.__new__(SpreadSheet)
+        spreadsheet.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
+        spreadsheet._gc = MagicMock()
+
+        first = spreadsheet.get_remote_spreadsheet()
+        second = spreadsheet.get_remote_spreadsheet()
+
+        self.assertIs(first, second)
+        spreadsheet._gc.open_by_url.assert_called_once_with(spreadsheet.sheet_url)
+
+    def test_remote_spreadsheet_reopened_when_url_changes(self):
+        spreadsheet = SpreadSheet.__new__(SpreadSheet)
+        spreadsheet.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
+        spreadsheet._gc = MagicMock()
+
+        spreadsheet.get_remote_spreadsheet()
+        spreadsheet.sheet_url = "https://docs.google.com/spreadsheets/d/test456"
+        spreadsheet.get_remote_spreadsheet()
+
+        self.assertEqual(spreadsheet._gc.open_by_url.call_count, 2)
+
+    @patch("frappe.enqueue")
+    def test_trigger_import_enqueues_each_worksheet(self, mock_enqueue):
+        spreadsheet = SpreadSheet.__new__(SpreadSheet)
+        spreadsheet.name = "test-spreadsheet"
+        spreadsheet.worksheet_ids = [frappe._dict(name="ws-0"), frappe._dict(name="ws-1")]
+
+        spreadsheet.trigger_import()
+
+        self.assertEqual(mock_enqueue.call_count, 2)
+        for call, worksheet in zip(mock_enqueue.call_args_list, spreadsheet.worksheet_ids):
+            self.assertEqual(call.args, (trigger_worksheet_import,))
+            self.assertEqual(call.kwargs["spreadsheet"], "test-spreadsheet")
+            self.assertEqual(call.kwargs["worksheet"], worksheet.name)
+            self.assertEqual(
+                call.kwargs["job_id"], f"sheets-import::test-spreadsheet::{worksheet.name}"
+            )
+            self.assertTrue(call.kwargs["deduplicate"])
+
+    def test_worksheet_job_runs_mapping_with_patched_importer(self):
+        ran_patched = []
+        mapping = MagicMock()
+        mapping.trigger_worksheet_import.side_effect = lambda: ran_patched.append(
+            hasattr(Importer, "patched")
+        )
+        spreadsheet = MagicMock()
+        spreadsheet.get.return_value = [mapping]
+
+        with patch("frappe.get_doc", return_value=spreadsheet) as mock_get_doc:
+            trigger_worksheet_import(spreadsheet="test-spreadsheet", worksheet="ws-1")
+
+        mock_get_doc.assert_called_once_with("SpreadSheet", "test-spreadsheet")
+        spreadsheet.get.assert_called_once_with("worksheet_ids", {"name": "ws-1"})
+        self.assertEqual(ran_patched, [True])
+        self.assertFalse(hasattr(Importer, "patched"))
+
+    def test_worksheet_job_updates_spreadsheet_modified(self):
+        spreadsheet = MagicMock()
+        spreadsheet.get.return_value = [MagicMock()]
+
+        with patch("frappe.get_doc", return_value=spreadsheet):
+            trigger_worksheet_import(spreadsheet="test-spreadsheet", worksheet="ws-1")
+
+        spreadsheet.db_set.assert_called_once_with("modified", ANY, notify=True)
+
+    def test_worksheet_job_skips_removed_worksheet(self):
+        spreadsheet = MagicMock()
+        spreadsheet.get.return_value = []
+
+        with patch("frappe.get_doc", return_value=spreadsheet), patch(
+            "sheets.sheets_workspace.doctype.spreadsheet.spreadsheet.patch_importer"
+        ) as mock_patch_importer:
+            trigger_worksheet_import(spreadsheet="test-spreadsheet", worksheet="ws-gone")
+
+        mock_patch_importer.assert_not_called()
+        spreadsheet.db_set.assert_not_called()
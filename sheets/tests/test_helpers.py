@@ -25,11 +25,17 @@ from sheets.constants import INSERT, UPDATE
 # ---------------------------------------------------------------------------
 
 
+# shared by make_csv(); tests run serially so a single buffer and writer are reused
+_CSV_BUFFER = StringIO()
+_CSV_WRITER = csv_writer(_CSV_BUFFER, lineterminator="\n")
+
+
 def make_csv(*rows):
     """Create a CSV string from rows (each row is a list of values)."""
-    buf = StringIO()
-    csv_writer(buf).writerows(rows)
-    return buf.getvalue()
+    _CSV_BUFFER.seek(0)
+    _CSV_BUFFER.truncate()
+    _CSV_WRITER.writerows(rows)
+    return _CSV_BUFFER.getvalue()
 
 
 def parse_csv(csv_string):
@@ -80,9 +86,25 @@ def make_mock_worksheet(data=None, worksheet_id=0):
     mock_ws.title = f"Sheet{worksheet_id + 1}"
     mock_ws.get_all_values.return_value = data
     mock_ws.row_values.return_value = data[0] if data else []
+    mock_ws.row_count = 1000  # default grid size of a new Google Sheet
+    mock_ws.get.side_effect = lambda range_name: _get_range(
+        mock_ws.get_all_values.return_value, range_name
+    )
     return mock_ws
 
 
+def _get_range(data, range_name):
+    """Slice `data` the way gspread's Worksheet.get() returns an A1 range."""
+    from gspread.utils import a1_range_to_grid_range
+
+    grid = a1_range_to_grid_range(range_name)
+    rows = data[grid.get("startRowIndex", 0) : grid.get("endRowIndex")]
+    # gspread returns [[]] when the range holds no values
+    return [
+        row[grid.get("startColumnIndex", 0) : grid.get("endColumnIndex")] for row in rows
+    ] or [[]]
+
+
 def make_mock_spreadsheet(worksheets=None, title="Test Spreadsheet"):
     """Create a mock gspread Spreadsheet object.
 
@@ -188,6 +210,10 @@ def make_worksheet_mapping(
         mock_parent = MagicMock()
     mock_parent.sheet_name = parent_sheet_name
     mock_parent.name = parent_name
+    # mirror SpreadSheet.get_remote_spreadsheet() on top of the mocked client
+    mock_parent.get_remote_spreadsheet.side_effect = lambda: (
+        mock_parent.get_sheet_client().open_by_url(mock_parent.sheet_url)
+    )
 
     return mapping, mock_parent
 
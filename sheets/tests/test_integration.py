@@ -387,6 +387,7 @@ class TestUpsertImportPipeline(FrappeTestCase):
 
             # Mock worksheet_id_field to return "ID"
             mock_ws_for_id = MagicMock()
+            mock_ws_for_id.row_count = 1000
             mock_ws_for_id.row_values.return_value = ["ID", "Description", "Status"]
             mock_client.open_by_url.return_value.get_worksheet_by_id.return_value = mock_ws_for_id
 
@@ -432,6 +433,7 @@ class TestUpsertImportPipeline(FrappeTestCase):
             self._create_successful_insert_import(mapping, mock_parent, csv_data)
 
             mock_ws_for_id = MagicMock()
+            mock_ws_for_id.row_count = 1000
             mock_ws_for_id.row_values.return_value = ["ID", "Description", "Status"]
             mock_ws_for_id.get_all_values.return_value = remote_data
             mock_client.open_by_url.return_value.get_worksheet_by_id.return_value = mock_ws_for_id
@@ -444,6 +446,44 @@ class TestUpsertImportPipeline(FrappeTestCase):
         if mapping.last_import:
             self._created_imports.append(mapping.last_import)
 
+    def test_upsert_ignores_width_of_cells_beyond_header(self):
+        """A note beyond the last header column doesn't make ranged inserts look changed."""
+        # full fetch pads to the widest row, ranged fetches stop at the header width
+        first_csv = make_csv(
+            ["ID", "Description", ""],
+            ["TODO-001", "Buy groceries", "note"],
+        )
+        second_csv = make_csv(
+            ["ID", "Description"],
+            ["TODO-002", "Walk the dog"],
+        )
+
+        remote_data = [
+            ["ID", "Description", ""],
+            ["TODO-001", "Buy groceries", "note"],
+            ["TODO-002", "Walk the dog", ""],
+        ]
+
+        mock_ws = make_mock_worksheet(data=remote_data)
+        mock_ss = make_mock_spreadsheet(worksheets=[mock_ws])
+        mock_client = make_mock_gspread_client(spreadsheet=mock_ss)
+
+        mapping, mock_parent = make_worksheet_mapping(
+            import_type="Upsert", counter=3
+        )
+        mock_parent.get_sheet_client.return_value = mock_client
+        mock_parent.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
+
+        with patch_parent_doc(mock_parent):
+            self._create_successful_insert_import(mapping, mock_parent, first_csv)
+            self._create_successful_insert_import(mapping, mock_parent, second_csv)
+
+            with patch.object(mapping, "save", return_value=mapping):
+                with patch("frappe.enqueue_doc"):
+                    mapping.trigger_upsert_worksheet_import()
+
+        self.assertFalse(mapping.last_update_import)
+
 
 class TestImportRouting(FrappeTestCase):
     """Tests that trigger_worksheet_import correctly routes to INSERT vs UPSERT."""
@@ -496,10 +536,10 @@ class TestDataImportCreation(FrappeTestCase):
     def test_creates_data_import_and_file(self):
         """create_data_import() creates both Data Import and File documents."""
         mapping, mock_parent = make_worksheet_mapping()
-        csv_data = make_csv(["Description", "Status"], ["Test", "Open"])
+        data = [["Description", "Status"], ["Test", "Open"]]
 
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data, import_type=INSERT)
+            di = mapping.create_data_import(data, import_type=INSERT)
 
         self._created_imports.append(di.name)
 
@@ -517,10 +557,10 @@ class TestDataImportCreation(FrappeTestCase):
     def test_creates_update_import(self):
         """create_data_import() can create UPDATE type imports."""
         mapping, mock_parent = make_worksheet_mapping()
-        csv_data = make_csv(["ID", "Status"], ["TODO-001", "Closed"])
+        data = [["ID", "Status"], ["TODO-001", "Closed"]]
 
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data, import_type=UPDATE)
+            di = mapping.create_data_import(data, import_type=UPDATE)
 
         self._created_imports.append(di.name)
         self.assertEqual(di.import_type, UPDATE)
@@ -528,10 +568,10 @@ class TestDataImportCreation(FrappeTestCase):
     def test_sets_spreadsheet_tracking_fields(self):
         """Data Import has spreadsheet_id and worksheet_id set."""
         mapping, mock_parent = make_worksheet_mapping(parent_name="my-spreadsheet")
-        csv_data = make_csv(["Description"], ["Test"])
+        data = [["Description"], ["Test"]]
 
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data)
+            di = mapping.create_data_import(data)
 
         self._created_imports.append(di.name)
         self.assertEqual(di.spreadsheet_id, "my-spreadsheet")
@@ -539,14 +579,14 @@ class TestDataImportCreation(FrappeTestCase):
 
     def test_csv_with_special_characters(self):
         """CSV with commas, quotes, and newlines survives round-trip."""
-        csv_data = make_csv(
+        data = [
             ["Description", "Notes"],
             ["Item, with comma", 'She said "hello"'],
-        )
+        ]
         mapping, mock_parent = make_worksheet_mapping()
 
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data)
+            di = mapping.create_data_import(data)
 
         self._created_imports.append(di.name)
 
@@ -557,10 +597,10 @@ class TestDataImportCreation(FrappeTestCase):
     def test_ignore_links_flag_is_set(self):
         """Data Import has flags.ignore_links set to True."""
         mapping, mock_parent = make_worksheet_mapping()
-        csv_data = make_csv(["Description"], ["Test"])
+        data = [["Description"], ["Test"]]
 
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data)
+            di = mapping.create_data_import(data)
 
         self._created_imports.append(di.name)
         # The flag is set on the doc object during creation
@@ -571,8 +611,8 @@ class TestDataImportCreation(FrappeTestCase):
 class TestFetchRemoteData(FrappeTestCase):
     """Integration tests for fetching and transforming remote spreadsheet data."""
 
-    def test_fetch_remote_worksheet_converts_to_csv(self):
-        """fetch_remote_worksheet() converts gspread data to CSV string."""
+    def test_fetch_remote_worksheet_returns_rows(self):
+        """fetch_remote_worksheet() returns gspread data as a list of rows."""
         data = [
             ["Name", "Email", "Age"],
             ["Alice", "alice@example.com", "30"],
@@ -587,15 +627,14 @@ class TestFetchRemoteData(FrappeTestCase):
         mock_parent.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
 
         with patch_parent_doc(mock_parent):
-            result = mapping.fetch_remote_worksheet()
+            rows = mapping.fetch_remote_worksheet()
 
-        rows = parse_csv(result)
         self.assertEqual(len(rows), 3)
         self.assertEqual(rows[0], ["Name", "Email", "Age"])
         self.assertEqual(rows[1], ["Alice", "alice@example.com", "30"])
 
     def test_fetch_remote_worksheet_empty(self):
-        """fetch_remote_worksheet() returns empty string for empty sheet."""
+        """fetch_remote_worksheet() returns no rows for empty sheet."""
         mock_ws = make_mock_worksheet(data=[])
         mock_ss = make_mock_spreadsheet(worksheets=[mock_ws])
         mock_client = make_mock_gspread_client(spreadsheet=mock_ss)
@@ -607,7 +646,7 @@ class TestFetchRemoteData(FrappeTestCase):
         with patch_parent_doc(mock_parent):
             result = mapping.fetch_remote_worksheet()
 
-        self.assertEqual(result, "")
+        self.assertEqual(result, [])
 
     def test_fetch_remote_spreadsheet_slices_by_counter(self):
         """fetch_remote_spreadsheet() returns only rows after counter."""
@@ -626,9 +665,8 @@ class TestFetchRemoteData(FrappeTestCase):
         mock_parent.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
 
         with patch_parent_doc(mock_parent):
-            result = mapping.fetch_remote_spreadsheet()
+            rows = mapping.fetch_remote_spreadsheet()
 
-        rows = parse_csv(result)
         self.assertEqual(len(rows), 3)  # header + 2 remaining rows
         self.assertEqual(rows[0], ["Description", "Status"])
         self.assertEqual(rows[1], ["Row 2", "Open"])
@@ -649,14 +687,13 @@ class TestFetchRemoteData(FrappeTestCase):
         mock_parent.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
 
         with patch_parent_doc(mock_parent):
-            result = mapping.fetch_remote_spreadsheet()
+            rows = mapping.fetch_remote_spreadsheet()
 
-        rows = parse_csv(result)
         self.assertEqual(len(rows), 1)  # only header
         self.assertEqual(rows[0], ["Description", "Status"])
 
     def test_fetch_handles_special_characters(self):
-        """CSV conversion preserves commas, quotes, and newlines in values."""
+        """Fetched rows preserve commas, quotes, and newlines in values."""
         data = [
             ["Name", "Description"],
             ["Alice, Bob", 'She said "hello"'],
@@ -671,9 +708,8 @@ class TestFetchRemoteData(FrappeTestCase):
         mock_parent.sheet_url = "https://docs.google.com/spreadsheets/d/test123"
 
         with patch_parent_doc(mock_parent):
-            result = mapping.fetch_remote_worksheet()
+            rows = mapping.fetch_remote_worksheet()
 
-        rows = parse_csv(result)
         self.assertEqual(rows[1], ["Alice, Bob", 'She said "hello"'])
         self.assertEqual(rows[2], ["Charlie\nNewline", "normal"])
 
@@ -963,15 +999,15 @@ class TestCsvRoundTrip(FrappeTestCase):
 
     def test_csv_with_unicode(self):
         """Unicode characters survive the full pipeline."""
-        csv_data = make_csv(
+        data = [
             ["Description", "Status"],
             ["Buy groceries \u2014 milk & eggs", "Open"],
             ["\u00c9mile's task", "Open"],
-        )
+        ]
 
         mapping, mock_parent = make_worksheet_mapping()
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data)
+            di = mapping.create_data_import(data)
 
         self._created_imports.append(di.name)
 
@@ -981,15 +1017,15 @@ class TestCsvRoundTrip(FrappeTestCase):
 
     def test_csv_with_empty_cells(self):
         """Empty cells are preserved through the pipeline."""
-        csv_data = make_csv(
+        data = [
             ["Description", "Status", "Priority"],
             ["Item 1", "", "High"],
             ["", "Open", ""],
-        )
+        ]
 
         mapping, mock_parent = make_worksheet_mapping()
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data)
+            di = mapping.create_data_import(data)
 
         self._created_imports.append(di.name)
 
@@ -999,15 +1035,15 @@ class TestCsvRoundTrip(FrappeTestCase):
 
     def test_csv_with_numeric_values(self):
         """Numeric values are preserved as strings through the pipeline."""
-        csv_data = make_csv(
+        data = [
             ["Description", "Count", "Price"],
             ["Widget", "42", "19.99"],
             ["Gadget", "0", "100.00"],
-        )
+        ]
 
         mapping, mock_parent = make_worksheet_mapping()
         with patch_parent_doc(mock_parent):
-            di = mapping.create_data_import(csv_data)
+            di = mapping.create_data_import(data)
 
         self._created_imports.append(di.name)
 